@@ -11,17 +11,27 @@ import os
 import sys
 import time
 import uuid
-import json
+import re
 import random
 import logging
+import functools
 import asyncio
+import contextlib
+import collections
 import argparse
+import orjson
 from quart import Quart, request, jsonify
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
 from camoufox.async_api import AsyncCamoufox
 from patchright.async_api import async_playwright
-from playwright.sync_api import sync_playwright
 from playwright_recaptcha import recaptchav2
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 COLORS = {
     'MAGENTA': '\033[35m',
     'BLUE': '\033[34m',
@@ -32,31 +42,53 @@ COLORS = {
 }
 
 
+_ts_cache = [0, ""]
+_URL_RE = re.compile(r"https?://[^\s]+")
+_SITEKEY_RE = re.compile(r"[A-Za-z0-9_-]{20,}")
+
+
 class CustomLogger(logging.Logger):
-    @staticmethod
-    def format_message(level, color, message):
-        timestamp = time.strftime('%H:%M:%S')
-        return f"[{timestamp}] [{COLORS.get(color)}{level}{COLORS.get('RESET')}] -> {message}"
+    LEVEL_LABELS = {
+        level: f"{COLORS[color]}{level}{COLORS['RESET']}"
+        for level, color in (
+            ('DEBUG', 'MAGENTA'),
+            ('INFO', 'BLUE'),
+            ('SUCCESS', 'GREEN'),
+            ('WARNING', 'YELLOW'),
+            ('ERROR', 'RED'),
+        )
+    }
+
+    @classmethod
+    def format_message(cls, level, message):
+        now = int(time.time())
+        if now != _ts_cache[0]:
+            _ts_cache[:] = [now, time.strftime('%H:%M:%S', time.localtime(now))]
+        return f"[{_ts_cache[1]}] [{cls.LEVEL_LABELS[level]}] -> {message}"
 
     def debug(self, message, *args, **kwargs):
-        super().debug(self.format_message('DEBUG', 'MAGENTA', message), *args, **kwargs)
+        if self.isEnabledFor(logging.DEBUG):
+            super().debug(self.format_message('DEBUG', message), *args, **kwargs)
 
     def info(self, message, *args, **kwargs):
-        super().info(self.format_message('INFO', 'BLUE', message), *args, **kwargs)
+        if self.isEnabledFor(logging.INFO):
+            super().info(self.format_message('INFO', message), *args, **kwargs)
 
     def success(self, message, *args, **kwargs):
-        super().info(self.format_message('SUCCESS', 'GREEN', message), *args, **kwargs)
+        if self.isEnabledFor(logging.INFO):
+            super().info(self.format_message('SUCCESS', message), *args, **kwargs)
 
     def warning(self, message, *args, **kwargs):
-        super().warning(self.format_message('WARNING', 'YELLOW', message), *args, **kwargs)
+        if self.isEnabledFor(logging.WARNING):
+            super().warning(self.format_message('WARNING', message), *args, **kwargs)
 
     def error(self, message, *args, **kwargs):
-        super().error(self.format_message('ERROR', 'RED', message), *args, **kwargs)
+        if self.isEnabledFor(logging.ERROR):
+            super().error(self.format_message('ERROR', message), *args, **kwargs)
 
 
 logging.setLoggerClass(CustomLogger)
 logger = logging.getLogger("ReCaptchaAPIServer")
-logger.setLevel(logging.DEBUG)
 handler = logging.StreamHandler(sys.stdout)
 logger.addHandler(handler)
 
@@ -74,52 +106,220 @@ class ReCaptchaAPIServer:
       </body>
     </html>
     """
+    HTML_TEMPLATE_PREFIX, HTML_TEMPLATE_SUFFIX = HTML_TEMPLATE.encode("utf-8").split(b"<RECAPTCHA_DIV>")
+    RESULTS_FILE = "results.jsonl"
+    FLUSH_INTERVAL = 5
+    CONTEXTS_PER_BROWSER = 1
+    CONTEXT_MAX_USES = 20
+    PROXY_MAX_USES = 5
+    CLEAR_STORAGE_SCRIPT = """
+    async () => {
+        try { localStorage.clear(); } catch (e) {}
+        try { sessionStorage.clear(); } catch (e) {}
+        try {
+            for (const db of await indexedDB.databases()) {
+                indexedDB.deleteDatabase(db.name);
+            }
+        } catch (e) {}
+    }
+    """
+    MAX_RESULTS = 10000
 
-    def __init__(self, headless: bool, useragent: str, debug: bool, browser_type: str, thread: int, proxy_support: bool):
+    def __init__(self, headless: bool, useragent: str, debug: bool, browser_type: str, thread: int, proxy_support: bool, result_wait: float = 10):
         self.app = Quart(__name__)
         self.debug = debug
+        logger.setLevel(logging.DEBUG if debug else logging.INFO)
         self.results = self._load_results()
         self.browser_type = browser_type
         self.headless = headless
         self.useragent = useragent
         self.thread_count = thread
         self.proxy_support = proxy_support
-        self.browser_pool = asyncio.Queue()
+        self.result_wait = result_wait
+        self._free = collections.deque()
+        self._free_sem = asyncio.Semaphore(0)
         self.browser_args = []
+        self._pending_results = []
+        self._flush_lock = asyncio.Lock()
+        self._flush_task = None
+        self._proxy_path = os.path.join(os.getcwd(), "proxies.txt")
+        self._proxy_configs = []
+        self._proxies_mtime = None
+        self._proxy_error = None
         
         if useragent:
             self.browser_args.append(f"--user-agent={useragent}")
 
         self._setup_routes()
 
-    @staticmethod
-    def _load_results():
-        """Load previous results from results.json."""
+    def _load_results(self):
+        """Load previous results from results.jsonl, later lines overriding earlier ones."""
+        results = collections.OrderedDict()
+        self._log_lines = 0
+        self._log_torn = False
+        self._log_load_failed = False
         try:
-            if os.path.exists("results.json"):
-                with open("results.json", "r") as f:
-                    return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            if os.path.exists(self.RESULTS_FILE):
+                with open(self.RESULTS_FILE, "rb") as f:
+                    for line_number, line in enumerate(f, start=1):
+                        if not line.strip():
+                            continue
+                        self._log_torn = not line.endswith(b"\n")
+                        try:
+                            entry = orjson.loads(line)
+                            entry.setdefault("status", "fail" if entry.get("value") == "CAPTCHA_FAIL" else "ok")
+                            results[entry.pop("task_id")] = entry
+                        except (orjson.JSONDecodeError, AttributeError, KeyError) as e:
+                            logger.warning(f"Skipping unreadable results line {line_number}: {str(e)}")
+                        self._log_lines += 1
+        except IOError as e:
             logger.warning(f"Error loading results: {str(e)}. Starting with an empty results dictionary.")
-        return {}
+            self._log_load_failed = True
+            return collections.OrderedDict()
 
-    def _save_results(self):
-        """Save results to results.json."""
+        while len(results) > self.MAX_RESULTS:
+            results.popitem(last=False)
+        return results
+
+    def _store_result(self, task_id: str, result) -> None:
+        """Insert a result or pending future, evicting the oldest entries past MAX_RESULTS."""
+        self.results[task_id] = result
+        while len(self.results) > self.MAX_RESULTS:
+            self.results.popitem(last=False)
+
+    def _append_results_sync(self, entries: list):
+        """Append result entries to results.jsonl, returning whether the write succeeded. Blocking; run it off the event loop."""
         try:
-            with open("results.json", "w") as result_file:
-                json.dump(self.results, result_file, indent=4)
+            with open(self.RESULTS_FILE, "ab") as result_file:
+                if self._log_torn:
+                    # Terminate a line torn by a crash so new entries start on their own line.
+                    result_file.write(b"\n")
+                    self._log_torn = False
+                result_file.writelines(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE) for entry in entries)
+            self._log_lines += len(entries)
+            return True
         except IOError as e:
             logger.error(f"Error saving results to file: {str(e)}")
+            return False
+
+    def _compact_results_sync(self, results: dict):
+        """Rewrite results.jsonl with only the live entries. Blocking; run it off the event loop."""
+        tmp_path = self.RESULTS_FILE + ".tmp"
+        try:
+            entries = [{"task_id": task_id, **result} for task_id, result in results.items() if isinstance(result, dict)]
+            with open(tmp_path, "wb") as result_file:
+                result_file.writelines(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE) for entry in entries)
+            os.replace(tmp_path, self.RESULTS_FILE)
+            self._log_lines = len(entries)
+        except IOError as e:
+            logger.error(f"Error compacting results file: {str(e)}")
+
+    async def _save_results_async(self) -> None:
+        """Append pending results in a worker thread, compacting the log once it grows too large."""
+        entries, self._pending_results = self._pending_results, []
+        if not await asyncio.to_thread(self._append_results_sync, entries):
+            # Keep the entries queued so the next flush retries them.
+            self._pending_results[:0] = entries
+            return
+
+        if not self._log_load_failed and self._log_lines > 2 * len(self.results):
+            await asyncio.to_thread(self._compact_results_sync, dict(self.results))
+
+    async def _flush_results(self) -> None:
+        """Write results to disk off the event loop if anything changed."""
+        async with self._flush_lock:
+            if not self._pending_results:
+                return
+            await self._save_results_async()
+
+    async def _flush_loop(self) -> None:
+        """Periodically persist results instead of rewriting the file on every solve."""
+        while True:
+            await asyncio.sleep(self.FLUSH_INTERVAL)
+            # Shielded so cancelling the loop never abandons a write running in a worker thread;
+            # the flush keeps holding the lock until the file is consistent again.
+            await asyncio.shield(self._flush_results())
+            if self.proxy_support:
+                await self._load_proxies()
+
+    @staticmethod
+    def _parse_proxy(proxy: str):
+        """Turn a proxies.txt line into a Playwright proxy config, or None if malformed."""
+        parts = proxy.split(':')
+        if len(parts) == 3:
+            return {"server": proxy}
+        elif len(parts) == 5:
+            proxy_scheme, proxy_ip, proxy_port, proxy_user, proxy_pass = parts
+            return {"server": f"{proxy_scheme}://{proxy_ip}:{proxy_port}", "username": proxy_user, "password": proxy_pass}
+        return None
+
+    @classmethod
+    def _read_proxies(cls, proxy_file_path: str, known_mtime):
+        """Read and parse proxies.txt, returning its modification time and proxy configs, or None if unchanged."""
+        mtime = os.path.getmtime(proxy_file_path)
+        if mtime == known_mtime:
+            return None
+
+        proxy_configs = []
+        with open(proxy_file_path) as proxy_file:
+            for line in proxy_file:
+                line = line.strip()
+                if not line:
+                    continue
+                proxy_config = cls._parse_proxy(line)
+                if proxy_config is None:
+                    logger.warning(f"Skipping invalid proxy format: {line}")
+                    continue
+                proxy_configs.append(proxy_config)
+        return mtime, proxy_configs
+
+    async def _load_proxies(self) -> None:
+        """(Re)load the proxy configs off the event loop when proxies.txt has changed."""
+        try:
+            loaded = await asyncio.to_thread(self._read_proxies, self._proxy_path, self._proxies_mtime)
+        except (OSError, ValueError) as e:
+            # Retried on every flush tick, so only report an error when it changes.
+            if str(e) != self._proxy_error:
+                self._proxy_error = str(e)
+                logger.error(f"Error loading proxies: {str(e)}")
+            return
+
+        self._proxy_error = None
+        if loaded:
+            self._proxies_mtime, self._proxy_configs = loaded
+            if self.debug:
+                logger.debug(f"Loaded {len(self._proxy_configs)} proxies")
+
+    async def _final_flush(self) -> None:
+        """Stop the flush loop and persist any pending results on shutdown."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+        await self._flush_results()
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _build_page_data(cls, sitekey: str, action: str) -> bytes:
+        """Build the encoded reCAPTCHA page once per sitekey/action pair."""
+        recaptcha_div = f'<div class="g-recaptcha" data-sitekey="{sitekey}" data-action="{action}"></div>'
+        return cls.HTML_TEMPLATE_PREFIX + recaptcha_div.encode("utf-8") + cls.HTML_TEMPLATE_SUFFIX
 
     def _setup_routes(self) -> None:
         """Set up the application routes."""
         self.app.before_serving(self._startup)
+        self.app.after_serving(self._final_flush)
         self.app.route('/recaptcha', methods=['GET'])(self.process_recaptcha)
         self.app.route('/result', methods=['GET'])(self.get_result)
         self.app.route('/')(self.index)
 
     async def _startup(self) -> None:
         """Initialize the browser and page pool on startup."""
+        if self.proxy_support:
+            await self._load_proxies()
+
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
         logger.info("Starting browser initialization")
         try:
             await self._initialize_browser()
@@ -128,87 +328,139 @@ class ReCaptchaAPIServer:
             raise
 
     async def _initialize_browser(self) -> None:
-        """Initialize the browser and create the page pool."""
-
-        if self.browser_type in ['chromium', 'chrome', 'msedge']:
+        """Initialize the browsers concurrently and create the context pool."""
+        playwright = None
+        if self.browser_type in ['chromium', 'chrome', 'msedge', 'firefox']:
             playwright = await async_playwright().start()
-        elif self.browser_type == "camoufox":
-            camoufox = AsyncCamoufox(headless=self.headless)
-
-        for _ in range(self.thread_count):
-            if self.browser_type in ['chromium', 'chrome', 'msedge']:
-                browser = await playwright.chromium.launch(
-                    channel=self.browser_type,
-                    headless=self.headless,
-                    args=self.browser_args
-                )
-
-            elif self.browser_type == "camoufox":
-                browser = await camoufox.start()
 
-            elif self.browser_type == "firefox":
-                browser = await playwright.firefox.launch()
-                
-            await self.browser_pool.put((_+1, browser))
+        started = await asyncio.gather(
+            *[self._start_browser(playwright) for _ in range(self.thread_count)],
+            return_exceptions=True
+        )
+
+        errors = [result for result in started if isinstance(result, BaseException)]
+        if errors:
+            for result in started:
+                if not isinstance(result, BaseException):
+                    with contextlib.suppress(Exception):
+                        await result[0].close()
+            if playwright is not None:
+                with contextlib.suppress(Exception):
+                    await playwright.stop()
+            raise errors[0]
+
+        for index, (browser, contexts) in enumerate(started, start=1):
+            for context, proxy_config in contexts:
+                self._pool_put((index, browser, context, proxy_config, 0))
 
             if self.debug:
-                logger.success(f"Browser {_ + 1} initialized successfully")
-
-        logger.success(f"Browser pool initialized with {self.browser_pool.qsize()} browsers")
+                logger.success(f"Browser {index} initialized successfully")
 
+        logger.success(f"Browser pool initialized with {len(self._free)} contexts")
 
-    async def _solve_recaptcha(self, task_id: str, url: str, sitekey: str, action: str = "verify", min_score: str = "3.0", invisible: str = "0", enterprise: str = "0", data_s: str = None):
-        """Solve the reCAPTCHA challenge."""
-        proxy = None
+    async def _start_browser(self, playwright):
+        """Launch a browser and create its pool contexts, closing it again if that fails."""
+        browser = await self._launch_one(playwright)
+        try:
+            contexts = await asyncio.gather(*[self._new_context(browser) for _ in range(self.CONTEXTS_PER_BROWSER)])
+        except BaseException:
+            with contextlib.suppress(Exception):
+                await browser.close()
+            raise
+        return browser, contexts
 
-        index, browser = await self.browser_pool.get()
+    async def _launch_one(self, playwright):
+        """Launch a single browser of the configured type."""
+        if self.browser_type in ['chromium', 'chrome', 'msedge']:
+            return await playwright.chromium.launch(
+                channel=self.browser_type,
+                headless=self.headless,
+                args=self.browser_args
+            )
 
+        elif self.browser_type == "camoufox":
+            return await AsyncCamoufox(headless=self.headless).start()
+
+        elif self.browser_type == "firefox":
+            return await playwright.firefox.launch()
+
+    def _pool_put(self, item) -> None:
+        """Return a (index, browser, context, proxy_config, uses) entry to the pool."""
+        self._free.append(item)
+        self._free_sem.release()
+
+    async def _pool_get(self):
+        """Wait for a free pool entry and take it."""
+        await self._free_sem.acquire()
+        return self._free.popleft()
+
+    async def _new_context(self, browser):
+        """Create a browser context, picking a random proxy when proxy support is enabled."""
+        proxy_config = random.choice(self._proxy_configs) if self.proxy_support and self._proxy_configs else None
+        context = await browser.new_context(proxy=proxy_config)
+        return context, proxy_config
+
+    async def _release_context(self, index: int, browser, context, proxy_config, uses: int, page, failed: bool) -> None:
+        """Reset the context and return it to the pool, recycling it when broken, worn out or due a new proxy."""
+        uses += 1
+        recycle = context is None or page is None or failed or uses >= self.CONTEXT_MAX_USES
         if self.proxy_support:
-            proxy_file_path = os.path.join(os.getcwd(), "proxies.txt")
-
-            with open(proxy_file_path) as proxy_file:
-                proxies = [line.strip() for line in proxy_file if line.strip()]
-
-            proxy = random.choice(proxies) if proxies else None
-
-            if proxy:
-                parts = proxy.split(':')
-                if len(parts) == 3:
-                    context = await browser.new_context(proxy={"server": f"{proxy}"})
-                elif len(parts) == 5:
-                    proxy_scheme, proxy_ip, proxy_port, proxy_user, proxy_pass = parts
-                    context = await browser.new_context(proxy={"server": f"{proxy_scheme}://{proxy_ip}:{proxy_port}", "username": proxy_user, "password": proxy_pass})
-                else:
-                    raise ValueError("Invalid proxy format")
-            else:
-                context = await browser.new_context()
-        else:
-            context = await browser.new_context()
+            recycle = recycle or uses >= self.PROXY_MAX_USES or proxy_config not in (self._proxy_configs or [None])
 
-        page = await context.new_page()
+        if not recycle:
+            try:
+                for frame in page.frames:
+                    with contextlib.suppress(Exception):
+                        await frame.evaluate(self.CLEAR_STORAGE_SCRIPT)
+                await page.close()
+                await context.clear_cookies()
+            except Exception as e:
+                logger.debug("Browser %s: Recreating context: %s", index, e)
+                recycle = True
+
+        if recycle:
+            if context is not None:
+                with contextlib.suppress(Exception):
+                    await context.close()
+            uses = 0
+            try:
+                context, proxy_config = await self._new_context(browser)
+            except Exception as e:
+                # Keep the slot; the context is created again when the entry is next acquired.
+                logger.error(f"Browser {index}: Failed to recreate context: {str(e)}")
+                context, proxy_config = None, None
+
+        self._pool_put((index, browser, context, proxy_config, uses))
+
+    async def _solve_recaptcha(self, task_id: str, url: str, sitekey: str, action: str = "verify", min_score: str = "3.0", invisible: str = "0", enterprise: str = "0", data_s: str = None):
+        """Solve the reCAPTCHA challenge."""
+        future = self.results.get(task_id)
+        index, browser, context, proxy_config, uses = await self._pool_get()
+        page = None
 
         start_time = time.time()
 
         try:
-            if self.debug:
-                logger.debug(f"Browser {index}: Starting reCAPTCHA solve for URL: {url} with Sitekey: {sitekey} | Proxy: {proxy}")
-                logger.debug(f"Browser {index}: Setting up page data and route")
-            else:
-                logger.debug(f"Browser {index}: Starting reCAPTCHA solve for URL: {url} with Sitekey: {sitekey} | Proxy: {proxy}")
-                logger.debug(f"Browser {index}: Setting up page data and route")
+            if context is None:
+                context, proxy_config = await self._new_context(browser)
+            proxy = proxy_config["server"] if proxy_config else None
+
+            page = await context.new_page()
+
+            logger.debug("Browser %s: Starting reCAPTCHA solve for URL: %s with Sitekey: %s | Proxy: %s", index, url, sitekey, proxy)
+            logger.debug("Browser %s: Setting up page data and route", index)
                 
             url_with_slash = url + "/" if not url.endswith("/") else url
            
-            recaptcha_div = f'<div class="g-recaptcha" data-sitekey="{sitekey}" data-action="{action}"></div>'
-            page_data = self.HTML_TEMPLATE.replace("<RECAPTCHA_DIV>", recaptcha_div)
+            page_data = self._build_page_data(sitekey, action)
 
-            await page.route(url_with_slash, lambda route: route.fulfill(body=page_data, status=200))
-            await page.goto(url_with_slash)
+            # The page has to be served on the target URL for the sitekey's domain check,
+            # so keep the interception but don't block on the full load event; the solver
+            # waits for the reCAPTCHA frames itself.
+            await page.route(url_with_slash, lambda route: route.fulfill(body=page_data, status=200, content_type="text/html"))
+            await page.goto(url_with_slash, wait_until="domcontentloaded")
 
-            if self.debug:
-                logger.debug(f"Browser {index}: Setting up reCAPTCHA widget dimensions")
-            else:
-                logger.debug(f"Browser {index}: Setting up reCAPTCHA widget dimensions")
+            logger.debug("Browser %s: Setting up reCAPTCHA widget dimensions", index)
                 
             if self.debug:
                 logger.debug(f"Browser {index}: Starting reCAPTCHA Solver")
@@ -222,9 +474,8 @@ class ReCaptchaAPIServer:
                     token = await solver.solve_recaptcha(wait=True)
 
                     try:
-                        self.results[task_id] = {"value": token, "elapsed_time": elapsed_time, "useragent": self.useragent}
-                        self._save_results()
-                                
+                        self.results[task_id] = {"status": "ok", "value": token, "elapsed_time": elapsed_time, "useragent": self.useragent}
+
                         logger.success(f"Browser {index}: Successfully solved captcha - {COLORS.get('MAGENTA')}{token[:10]}{COLORS.get('RESET')} in {COLORS.get('GREEN')}{elapsed_time}{COLORS.get('RESET')} Seconds")
                     except IOError as e:
                         logger.error(f"Browser {index}: Error saving results to file: {str(e)}")
@@ -235,22 +486,27 @@ class ReCaptchaAPIServer:
             except Exception as e:  
                 logger.error(f"Browser {index} | #2: Error solving reCAPTCHA: {str(e)}")    
                 
-            if self.results.get(task_id) == "CAPTCHA_NOT_READY":
+            if self.results.get(task_id) is future:
                 elapsed_time = round(time.time() - start_time, 3)
-                self.results[task_id] = {"value": "CAPTCHA_FAIL", "elapsed_time": elapsed_time}
+                self.results[task_id] = {"status": "fail", "value": "CAPTCHA_FAIL", "elapsed_time": elapsed_time}
                 if self.debug:
                     logger.error(f"Browser {index} | #3: Error solving reCAPTCHA in {COLORS.get('RED')}{elapsed_time}{COLORS.get('RESET')} Seconds")
         except Exception as e:
             elapsed_time = round(time.time() - start_time, 3)
-            self.results[task_id] = {"value": "CAPTCHA_FAIL", "elapsed_time": elapsed_time}
+            self.results[task_id] = {"status": "fail", "value": "CAPTCHA_FAIL", "elapsed_time": elapsed_time}
             if self.debug:
                 logger.error(f"Browser {index} | #4: Error solving reCAPTCHA: {str(e)}")
         finally:
-            if self.debug:
-                logger.debug(f"Browser {index}: Clearing page state")
+            logger.debug("Browser %s: Clearing page state", index)
 
-            await context.close()
-            await self.browser_pool.put((index, browser))
+            result = self.results.get(task_id)
+            if isinstance(result, dict):
+                self._pending_results.append({"task_id": task_id, **result})
+                if future is not None and not future.done():
+                    future.set_result(result)
+
+            failed = not isinstance(result, dict) or result["status"] == "fail"
+            await self._release_context(index, browser, context, proxy_config, uses, page, failed)
 
     async def process_recaptcha(self):
         """Handle the /reCAPTCHA endpoint requests."""
@@ -268,8 +524,14 @@ class ReCaptchaAPIServer:
                 "error": "Both 'url' and 'sitekey' are required"
             }), 400
 
-        task_id = str(uuid.uuid4())
-        self.results[task_id] = "CAPTCHA_NOT_READY"
+        if not _URL_RE.fullmatch(url) or not _SITEKEY_RE.fullmatch(sitekey):
+            return jsonify({
+                "status": "error",
+                "error": "Invalid 'url' or 'sitekey' format"
+            }), 400
+
+        task_id = uuid.uuid4().hex
+        self._store_result(task_id, asyncio.get_running_loop().create_future())
 
         try:
             asyncio.create_task(self._solve_recaptcha(task_id=task_id, url=url, sitekey=sitekey, action=action, min_score=min_score, invisible=invisible, enterprise=enterprise, data_s=data_s))
@@ -292,11 +554,14 @@ class ReCaptchaAPIServer:
             return jsonify({"status": "error", "error": "Invalid task ID/Request parameter"}), 400
 
         result = self.results[task_id]
-        status_code = 200
 
-        if "CAPTCHA_FAIL" in result:
-            status_code = 422
+        if isinstance(result, asyncio.Future):
+            try:
+                result = await asyncio.wait_for(asyncio.shield(result), timeout=self.result_wait)
+            except asyncio.TimeoutError:
+                return {"status": "pending", "value": "CAPTCHA_NOT_READY"}, 200
 
+        status_code = 422 if result["status"] == "fail" else 200
         return result, status_code
 
     @staticmethod
@@ -325,7 +590,7 @@ class ReCaptchaAPIServer:
 
                     <div class="bg-gray-700 p-4 rounded-lg mb-6 border border-red-500">
                         <p class="font-semibold mb-2 text-red-400">Example usage:</p>
-                        <code class="text-sm break-all text-red-300">/recaptcha?url=https://example.com&sitekey=sitekey</code>
+                        <code class="text-sm break-all text-red-300">/recaptcha?url=https://example.com&sitekey=6LeIxAcTAAAAAJcZVRqyHh71UMIEGNQ_MXjiZKhI</code>
                     </div>
                 </div>
             </body>
@@ -345,11 +610,12 @@ def parse_args():
     parser.add_argument('--proxy', type=bool, default=False, help='Enable proxy support for the solver (Default: False)')
     parser.add_argument('--host', type=str, default='127.0.0.1', help='Specify the IP address where the API solver runs. (Default: 127.0.0.1)')
     parser.add_argument('--port', type=str, default='8000', help='Set the port for the API solver to listen on. (Default: 8000)')
+    parser.add_argument('--result_wait', type=float, default=10, help='Maximum number of seconds /result waits for an unfinished task before answering CAPTCHA_NOT_READY. Use 0 to answer immediately (Default: 10)')
     return parser.parse_args()
 
 
-def create_app(headless: bool, useragent: str, debug: bool, browser_type: str, thread: int, proxy_support: bool) -> Quart:
-    server = ReCaptchaAPIServer(headless=headless, useragent=useragent, debug=debug, browser_type=browser_type, thread=thread, proxy_support=proxy_support)
+def create_app(headless: bool, useragent: str, debug: bool, browser_type: str, thread: int, proxy_support: bool, result_wait: float = 10) -> Quart:
+    server = ReCaptchaAPIServer(headless=headless, useragent=useragent, debug=debug, browser_type=browser_type, thread=thread, proxy_support=proxy_support, result_wait=result_wait)
     return server.app
 
 
@@ -367,5 +633,11 @@ if __name__ == '__main__':
     elif args.headless is True and args.useragent is None and "camoufox" not in args.browser_type:
         logger.error(f"You must specify a {COLORS.get('YELLOW')}User-Agent{COLORS.get('RESET')} for reCAPTCHA Solver or use {COLORS.get('GREEN')}camoufox{COLORS.get('RESET')} without useragent")
     else:
-        app = create_app(headless=args.headless, debug=args.debug, useragent=args.useragent, browser_type=args.browser_type, thread=args.thread, proxy_support=args.proxy)
-        app.run(host=args.host, port=int(args.port))
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+        app = create_app(headless=args.headless, debug=args.debug, useragent=args.useragent, browser_type=args.browser_type, thread=args.thread, proxy_support=args.proxy, result_wait=args.result_wait)
+        config = Config()
+        config.bind = [f"{args.host}:{int(args.port)}"]
+        config.accesslog = "-"
+        asyncio.run(serve(app, config))